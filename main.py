@@ -3,16 +3,23 @@ import os
 import re
 import requests
 import time
-import traceback
+import logging
 from io import StringIO
 from datetime import datetime
 import hashlib
-from http.server import HTTPServer, BaseHTTPRequestHandler
+import json
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 import threading
 import urllib.parse
 import zipfile
 import random
+import queue
+import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from waybackpy import WaybackMachineSaveAPI
+from waybackpy.exceptions import TooManyRequestsError
 
 REMOTE_CSV_URL = "https://sheets.artistgrid.cx/artists.csv"
 CACHE_FILE = "last_artists.csv"
@@ -20,21 +27,114 @@ EXPORT_DIR = "downloads"
 SLEEP_INTERVAL_SECONDS = 3600  # 1 hour
 HOST = "0.0.0.0"
 PORT = 8000
+LOG_FORMAT = "[%(asctime)s] %(message)s"
+LIMIT_INITIAL = 4
+LIMIT_MAX = 16
+LIMIT_INCREASE_EVERY = 5  # successes needed before allowing one more request
+THROTTLE_STATUSES = {429, 500, 502, 503, 504}
+USER_AGENT = "Mozilla/5.0 (ArtistGrid Tracker)"
+REQUEST_TIMEOUT = (10, 120)  # (connect, read) seconds
+COPY_CHUNK_SIZE = 1024 * 1024
+PARTIAL_SUFFIX = ".part"  # in-progress writes, renamed over the real file once complete
+HASH_WORKERS = 4
+ARCHIVE_WORKERS = 2
+ARCHIVE_GAP_SECONDS = 20  # pause after each Wayback save, scaled up while throttled
+
+SHEET_URL_RE = re.compile(r"https://docs\.google\.com/spreadsheets/d/([a-zA-Z0-9-_]{44})")
+SHEET_ID_RE = re.compile(r"/d/([a-zA-Z0-9-_]{44})/")
+NORMALIZE_RE = re.compile(r'[^a-z0-9]')
+SANITIZE_RE = re.compile(r'[^a-zA-Z0-9_.-]')
+
+def build_translate_table(allowed, replacements):
+    """Latin-1 translate table: keeps allowed chars, applies replacements, drops the rest."""
+    table = {c: None for c in range(256)}
+    table.update({ord(c): ord(c) for c in allowed})
+    table.update({ord(k): v for k, v in replacements.items()})
+    return table
+
+NORMALIZE_TABLE = build_translate_table("abcdefghijklmnopqrstuvwxyz0123456789", {"$": "s"})
+SANITIZE_TABLE = build_translate_table(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_.-", {"$": "s"}
+)
+
+logger = logging.getLogger(__name__)
+
+# Shared session so downloads reuse pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": USER_AGENT})
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=sorted(THROTTLE_STATUSES)),
+))
+
+class Limiter:
+    """AIMD concurrency limit: halves on throttling, grows by one after a run of successes."""
+
+    def __init__(self, initial=LIMIT_INITIAL, maximum=LIMIT_MAX, increase_every=LIMIT_INCREASE_EVERY):
+        self.limit = initial
+        self.initial = initial
+        self.maximum = maximum
+        self.increase_every = increase_every
+        self.active = 0
+        self.successes = 0
+        self.cond = threading.Condition()
+
+    def __enter__(self):
+        with self.cond:
+            while self.active >= self.limit:
+                self.cond.wait()
+            self.active += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        with self.cond:
+            self.active -= 1
+            if exc is None:
+                self.successes += 1
+                if self.successes >= self.increase_every and self.limit < self.maximum:
+                    self.limit += 1
+                    self.successes = 0
+            elif is_throttled(exc):
+                self.limit = max(1, self.limit // 2)
+                self.successes = 0
+                logger.warning("🐢 Throttled, concurrency limit now %s", self.limit)
+            self.cond.notify_all()
+        return False
+
+    def slowdown(self):
+        """Multiplier for fixed delays; above 1 while the limit is below its starting value."""
+        return max(1, self.initial // self.limit)
+
+def is_throttled(exc):
+    if isinstance(exc, (requests.exceptions.ConnectionError, requests.exceptions.RetryError, TooManyRequestsError)):
+        return True
+    if isinstance(exc, requests.exceptions.HTTPError) and exc.response is not None:
+        return exc.response.status_code in THROTTLE_STATUSES
+    return False
+
+# Shared by Google Sheets downloads and Wayback saves
+LIMITER = Limiter()
+
+# (file_path, public_url, not_before) jobs waiting for the archive workers
+ARCHIVE_QUEUE = queue.Queue()
+# (file_path, public_url) pairs queued or in progress, so repeat runs don't pile up duplicates
+_archive_pending = set()
+_archive_pending_lock = threading.Lock()
+
+# Hashes files for artist pages; shared so page renders don't spin up their own threads
+HASH_EXECUTOR = ThreadPoolExecutor(max_workers=HASH_WORKERS)
 
 def normalize_artist_name(name):
-    name = name.lower()
-    name = name.replace("$", "s")        # Replace $ with s first
-    return re.sub(r'[^a-z0-9]', '', name)
+    # $ becomes s; the table only covers Latin-1, so the regex mops up anything wider
+    name = name.lower().translate(NORMALIZE_TABLE)
+    return name if name.isascii() else NORMALIZE_RE.sub('', name)
 
 
 def sanitize_filename(filename):
-    # Replace $ with s first
-    filename = filename.replace("$", "s")
-    # Remove spaces
-    filename = filename.replace(" ", "")
-    # Remove all characters except letters, numbers, underscore, dot, dash
-    filename = re.sub(r'[^a-zA-Z0-9_.-]', '', filename)
-    return filename
+    # Replace $ with s, keep only letters, numbers, underscore, dot, dash
+    filename = filename.translate(SANITIZE_TABLE)
+    return filename if filename.isascii() else SANITIZE_RE.sub('', filename)
 
 
 def log_down_host(url):
@@ -43,23 +143,28 @@ def log_down_host(url):
         f.write(f"{url}\n")
 
 def clean_url(url):
-    match = re.search(r"https://docs\.google\.com/spreadsheets/d/([a-zA-Z0-9-_]{44})", url)
+    match = SHEET_URL_RE.search(url)
     return f"https://docs.google.com/spreadsheets/d/{match.group(1)}/" if match else None
 
 def extract_sheet_id(url):
-    match = re.search(r"/d/([a-zA-Z0-9-_]{44})/", url)
+    match = SHEET_ID_RE.search(url)
     return match.group(1) if match else None
 
 def sha256_of_file(path):
-    hash_sha256 = hashlib.sha256()
     try:
         with open(path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
+            if hasattr(hashlib, "file_digest"):  # Python 3.11+
+                return hashlib.file_digest(f, "sha256").hexdigest()
+            hash_sha256 = hashlib.sha256()
+            for chunk in iter(lambda: f.read(COPY_CHUNK_SIZE), b""):
                 hash_sha256.update(chunk)
-        return hash_sha256.hexdigest()
+            return hash_sha256.hexdigest()
     except:
         return None
 
+# Serializes .meta read-modify-write across HTTP, download and archive threads
+_metadata_lock = threading.RLock()
+
 def get_metadata_path(file_path):
     return file_path + ".meta"
 
@@ -68,14 +173,41 @@ def load_metadata(file_path):
     if not os.path.exists(meta_path):
         return {}
     with open(meta_path, "r", encoding="utf-8") as f:
-        lines = f.read().splitlines()
-        return dict(line.split(":", 1) for line in lines if ":" in line)
+        text = f.read()
+    try:
+        metadata = json.loads(text)
+        if isinstance(metadata, dict):
+            return metadata
+    except ValueError:
+        pass
+    # Legacy "key:value" per line format, rewritten as JSON on the next save
+    return dict(line.split(":", 1) for line in text.splitlines() if ":" in line)
 
 def save_metadata(file_path, metadata):
+    # Replace rather than truncate so concurrent readers never see a partial file
     meta_path = get_metadata_path(file_path)
-    with open(meta_path, "w", encoding="utf-8") as f:
-        for key, value in metadata.items():
-            f.write(f"{key}:{value}\n")
+    with _metadata_lock:
+        with open(meta_path + PARTIAL_SUFFIX, "w", encoding="utf-8") as f:
+            json.dump(metadata, f)
+        os.replace(meta_path + PARTIAL_SUFFIX, meta_path)
+
+def update_metadata(file_path, changes):
+    """Merge changes into the file's .meta without losing fields written by other threads."""
+    with _metadata_lock:
+        metadata = load_metadata(file_path)
+        metadata.update(changes)
+        save_metadata(file_path, metadata)
+
+def cached_sha256(file_path, st):
+    """Return the file's SHA256, reusing the .meta digest while size and mtime are unchanged."""
+    metadata = load_metadata(file_path)
+    stamp = f"{st.st_size}:{st.st_mtime_ns}"
+    if metadata.get("stamp") == stamp and metadata.get("sha256"):
+        return metadata["sha256"]
+    sha = sha256_of_file(file_path)
+    if sha:
+        update_metadata(file_path, {"stamp": stamp, "sha256": sha})
+    return sha
 
 def should_archive_today(lastarchive):
     try:
@@ -85,94 +217,180 @@ def should_archive_today(lastarchive):
         return True
 
 def archive_file(file_path, public_url):
-    metadata = load_metadata(file_path)
-    sha = sha256_of_file(file_path)
-    lastarchive = metadata.get("lastarchive")
+    sha = cached_sha256(file_path, os.stat(file_path))
+    lastarchive = load_metadata(file_path).get("lastarchive")
 
     if not should_archive_today(lastarchive):
-        print(f"[{datetime.now()}] ⏩ Skipping archive (already done today): {file_path}")
+        logger.info("⏩ Skipping archive (already done today): %s", file_path)
         return
 
-    delay = random.randint(7, 13) * 60
-    print(f"[{datetime.now()}] ⏱ Waiting {delay//60} min before archiving: {file_path}")
-    time.sleep(delay)
-
     try:
-        print(f"[{datetime.now()}] 🌍 Archiving {public_url}")
+        logger.info("🌍 Archiving %s", public_url)
         save_api = WaybackMachineSaveAPI(public_url, user_agent="Mozilla/5.0 (Wayback Tracker)")
-        archive_url = save_api.save()
-        print(f"[{datetime.now()}] ✅ Archived: {archive_url}")
+        with LIMITER:
+            archive_url = save_api.save()
+        logger.info("✅ Archived: %s", archive_url)
+
+        update_metadata(file_path, {
+            "archivedsha256": sha,
+            "lastarchive": datetime.now().strftime("%Y-%m-%d"),
+        })
+    except Exception as e:
+        logger.error("❌ Archiving failed for %s: %s", public_url, e)
+    time.sleep(ARCHIVE_GAP_SECONDS * LIMITER.slowdown())
+
+def queue_archive_batch(files):
+    """Queue files for archiving after one shared ~10 minute delay, skipping ones already pending."""
+    delay = random.randint(7, 13) * 60 * LIMITER.slowdown()
+    not_before = time.monotonic() + delay
+    queued = 0
+    with _archive_pending_lock:
+        for file_path, public_url in files:
+            if (file_path, public_url) in _archive_pending:
+                continue
+            _archive_pending.add((file_path, public_url))
+            ARCHIVE_QUEUE.put((file_path, public_url, not_before))
+            queued += 1
+    if queued:
+        logger.info("⏱ Archiving %s file(s) starting in %s min", queued, delay // 60)
 
-        metadata["sha256"] = sha
-        metadata["lastarchive"] = datetime.now().strftime("%Y-%m-%d")
-        save_metadata(file_path, metadata)
+def archive_worker():
+    while True:
+        file_path, public_url, not_before = ARCHIVE_QUEUE.get()
+        try:
+            wait = not_before - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            archive_file(file_path, public_url)
+        except Exception as e:
+            logger.error("❌ Archive worker error for %s: %s", file_path, e, exc_info=True)
+        finally:
+            with _archive_pending_lock:
+                _archive_pending.discard((file_path, public_url))
+            ARCHIVE_QUEUE.task_done()
+
+def start_archive_workers():
+    for _ in range(ARCHIVE_WORKERS):
+        threading.Thread(target=archive_worker, daemon=True).start()
+
+def stream_to_file(source, path):
+    """Copy source into path through a temp file so the previous copy survives a failed write."""
+    part_path = path + PARTIAL_SUFFIX
+    try:
+        with open(part_path, "wb") as f:
+            shutil.copyfileobj(source, f, COPY_CHUNK_SIZE)
+        os.replace(part_path, path)
+    except BaseException:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        raise
+
+def remote_unchanged(url, path):
+    """HEAD probe: True if the export's ETag matches the one stored for the local copy."""
+    etag = load_metadata(path).get("etag")
+    if not etag or not os.path.exists(path):
+        return False
+    try:
+        with LIMITER:
+            head = SESSION.head(url, allow_redirects=True, timeout=REQUEST_TIMEOUT)
+            head.raise_for_status()
     except Exception as e:
-        print(f"[{datetime.now()}] ❌ Archiving failed for {public_url}: {e}")
+        logger.warning("⚠️ HEAD probe failed for %s: %s", url, e)
+        return False
+    return head.headers.get("ETag") == etag
+
+def download_file(url, path):
+    """Stream url to path unless unchanged.
+
+    Returns the validators to record with update_metadata() once the file is known
+    to be usable, or None if the download was skipped.
+    """
+    if remote_unchanged(url, path):
+        return None
+    # Forget the old ETag so a failed rewrite is never mistaken for an up-to-date copy
+    update_metadata(path, {"etag": "", "contentlength": ""})
+    with LIMITER, SESSION.get(url, timeout=REQUEST_TIMEOUT, stream=True) as r:
+        r.raise_for_status()
+        r.raw.decode_content = True
+        stream_to_file(r.raw, path)
+        return {
+            "etag": r.headers.get("ETag", ""),
+            "contentlength": r.headers.get("Content-Length", ""),
+        }
 
 def download_exports(sheet_id, artist_dir):
     os.makedirs(artist_dir, exist_ok=True)
-    print(f"[{datetime.now()}] 📁 Starting download for sheet ID: {sheet_id} into '{artist_dir}'")
+    logger.info("📁 Starting download for sheet ID: %s into '%s'", sheet_id, artist_dir)
 
     # XLSX
     xlsx_url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=xlsx"
     xlsx_path = os.path.join(artist_dir, "spreadsheet.xlsx")
     try:
-        print(f"[{datetime.now()}] ⬇️ Attempting XLSX download from: {xlsx_url}")
-        r = requests.get(xlsx_url)
-        r.raise_for_status()
-        with open(xlsx_path, "wb") as f:
-            f.write(r.content)
-        print(f"[{datetime.now()}] ✓ XLSX downloaded: {xlsx_path} ({len(r.content)} bytes)")
+        logger.info("⬇️ Attempting XLSX download from: %s", xlsx_url)
+        validators = download_file(xlsx_url, xlsx_path)
+        if validators is None:
+            logger.info("⏩ XLSX unchanged, skipping: %s", xlsx_path)
+        else:
+            update_metadata(xlsx_path, validators)
+            logger.info("✓ XLSX downloaded: %s (%s bytes)", xlsx_path, os.path.getsize(xlsx_path))
     except Exception as e:
-        print(f"[{datetime.now()}] ⚠️ XLSX download failed for {xlsx_path}: {e}")
-        print(traceback.format_exc())
-        if isinstance(e, requests.exceptions.HTTPError) and r.status_code == 401:
+        logger.warning("⚠️ XLSX download failed for %s: %s", xlsx_path, e, exc_info=True)
+        if isinstance(e, requests.exceptions.HTTPError) and e.response.status_code == 401:
             log_down_host(xlsx_url)
 
     # ZIP
     zip_url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=zip"
     zip_path = os.path.join(artist_dir, "spreadsheet.zip")
     try:
-        print(f"[{datetime.now()}] ⬇️ Attempting ZIP download from: {zip_url}")
-        r = requests.get(zip_url)
-        r.raise_for_status()
-        with open(zip_path, "wb") as f:
-            f.write(r.content)
-        print(f"[{datetime.now()}] ✓ ZIP downloaded: {zip_path} ({len(r.content)} bytes)")
+        logger.info("⬇️ Attempting ZIP download from: %s", zip_url)
+        validators = download_file(zip_url, zip_path)
+        if validators is None:
+            logger.info("⏩ ZIP unchanged, skipping download and extraction: %s", zip_path)
+            return
+        logger.info("✓ ZIP downloaded: %s (%s bytes)", zip_path, os.path.getsize(zip_path))
 
         with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            print(f"[{datetime.now()}] 📦 ZIP opened. Extracting files...")
+            logger.info("📦 ZIP opened. Extracting files...")
             for member in zip_ref.namelist():
                 original_name = os.path.basename(member)
                 if not original_name:
                     continue
                 sanitized_name = sanitize_filename(original_name)
-                source = zip_ref.open(member)
                 target_path = os.path.join(artist_dir, sanitized_name)
-                with open(target_path, "wb") as target:
-                    with source:
-                        data = source.read()
-                        target.write(data)
-                        print(f"[{datetime.now()}] → Extracted: {target_path} ({len(data)} bytes)")
-        print(f"[{datetime.now()}] ✓ ZIP extraction complete for {artist_dir}")
+                with zip_ref.open(member) as source:
+                    stream_to_file(source, target_path)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("→ Extracted: %s (%s bytes)", target_path, os.path.getsize(target_path))
+        # Only now is the ZIP's ETag safe to trust for skipping re-extraction
+        update_metadata(zip_path, validators)
+        logger.info("✓ ZIP extraction complete for %s", artist_dir)
 
     except Exception as e:
-        print(f"[{datetime.now()}] ⚠️ ZIP download or extraction failed for {zip_path}: {e}")
-        print(traceback.format_exc())
-        if isinstance(e, requests.exceptions.HTTPError) and r.status_code == 401:
+        logger.warning("⚠️ ZIP download or extraction failed for %s: %s", zip_path, e, exc_info=True)
+        if isinstance(e, requests.exceptions.HTTPError) and e.response.status_code == 401:
             log_down_host(zip_url)
 
-def parse_csv(text):
-    reader = csv.DictReader(StringIO(text))
-    result = {}
-    for row in reader:
+def update_artist(artist, sheet_id):
+    artist_dir = os.path.join(EXPORT_DIR, artist)
+    download_exports(sheet_id, artist_dir)
+    # Overwritten files don't bump the directory mtime, so drop the page explicitly
+    invalidate_page(artist)
+
+    files = []
+    for entry in os.scandir(artist_dir):
+        if entry.is_file() and not entry.name.endswith((".meta", PARTIAL_SUFFIX)):
+            public_url = f"https://trackers.artistgrid.cx/downloads/{urllib.parse.quote(artist)}/{urllib.parse.quote(entry.name)}"
+            files.append((entry.path, public_url))
+    return files
+
+def iter_rows(text):
+    for row in csv.DictReader(StringIO(text)):
         if row.get("Best", "").strip().lower() != "yes":
             continue
         artist = normalize_artist_name(row["Artist Name"])
         url = clean_url(row["URL"])
         if artist and url:
-            result[artist] = url
-    return result
+            yield artist, url
 
 def save_csv(data, path):
     with open(path, "w", newline="", encoding="utf-8") as f:
@@ -191,63 +409,105 @@ def load_cached_csv(path):
 def format_timestamp(ts):
     return datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S")
 
+# Rendered HTML pages keyed by name, stored as (generation, directory mtime_ns, html).
+# invalidate_page() bumps the generation so renders that raced a download are never stored.
+_page_cache = {}
+_page_generations = {}
+_page_cache_lock = threading.Lock()
+ARTIST_LIST_PAGE = ""
+
+def cached_page(key, directory, build):
+    try:
+        mtime = os.stat(directory).st_mtime_ns
+    except OSError:
+        mtime = None
+    with _page_cache_lock:
+        generation = _page_generations.get(key, 0)
+        cached = _page_cache.get(key)
+    if cached and cached[:2] == (generation, mtime):
+        return cached[2]
+    html = build()
+    with _page_cache_lock:
+        if _page_generations.get(key, 0) == generation:
+            _page_cache[key] = (generation, mtime, html)
+    return html
+
+def invalidate_page(key):
+    with _page_cache_lock:
+        _page_generations[key] = _page_generations.get(key, 0) + 1
+        _page_cache.pop(key, None)
+
 def run_once():
-    print(f"[{datetime.now()}] 🔍 Checking for updates...")
+    logger.info("🔍 Checking for updates...")
+    csv_meta = load_metadata(CACHE_FILE) if os.path.exists(CACHE_FILE) else {}
+    headers = {}
+    if csv_meta.get("etag"):
+        headers["If-None-Match"] = csv_meta["etag"]
+    if csv_meta.get("lastmodified"):
+        headers["If-Modified-Since"] = csv_meta["lastmodified"]
     try:
-        response = requests.get(REMOTE_CSV_URL)
+        response = SESSION.get(REMOTE_CSV_URL, headers=headers, timeout=REQUEST_TIMEOUT, stream=True)
+        if response.status_code == 304:
+            response.close()
+            logger.info("✅ Remote CSV unchanged.\n")
+            return
         response.raise_for_status()
-        remote_data = parse_csv(response.text)
+        cached_data = load_cached_csv(CACHE_FILE)
+        # Build the new cache and the diff in a single pass over the rows
+        remote_data = {}
+        to_update = {}
+        for artist, url in iter_rows(response.text):
+            remote_data[artist] = url
+            if cached_data.get(artist) != url:
+                to_update[artist] = url
+            else:
+                to_update.pop(artist, None)  # a later duplicate row restored the cached URL
     except Exception as e:
-        print(f"[{datetime.now()}] ❌ Failed to fetch remote CSV: {e}")
-        print(traceback.format_exc())
+        logger.error("❌ Failed to fetch remote CSV: %s", e, exc_info=True)
         return
 
-    cached_data = load_cached_csv(CACHE_FILE)
-
-    to_update = {
-        artist: url for artist, url in remote_data.items()
-        if artist not in cached_data or cached_data[artist] != url
-    }
-
     if not to_update:
-        print(f"[{datetime.now()}] ✅ No updates found.")
+        logger.info("✅ No updates found.")
     else:
-        print(f"[{datetime.now()}] 🔄 {len(to_update)} update(s) found.")
+        logger.info("🔄 %s update(s) found.", len(to_update))
 
         # Collect all files to archive after all downloads finish
         files_to_archive = []
 
+        tasks = []
         for artist, url in to_update.items():
-            print(f"[{datetime.now()}] 🎯 Updating: {artist} | URL: {url}")
+            logger.info("🎯 Updating: %s | URL: %s", artist, url)
             sheet_id = extract_sheet_id(url)
             if sheet_id:
-                artist_dir = os.path.join(EXPORT_DIR, artist)
-                download_exports(sheet_id, artist_dir)
-
-                # Collect files for archiving after all downloads
-                for filename in os.listdir(artist_dir):
-                    file_path = os.path.join(artist_dir, filename)
-                    if os.path.isfile(file_path):
-                        public_url = f"https://trackers.artistgrid.cx/downloads/{urllib.parse.quote(artist)}/{urllib.parse.quote(filename)}"
-                        files_to_archive.append((file_path, public_url))
+                tasks.append((artist, sheet_id))
             else:
-                print(f"[{datetime.now()}] ⚠️ Invalid URL for {artist}: {url}")
+                logger.warning("⚠️ Invalid URL for %s: %s", artist, url)
 
-        print(f"[{datetime.now()}] ✅ All downloads complete. Starting archiving of {len(files_to_archive)} files.")
+        with ThreadPoolExecutor(max_workers=LIMIT_MAX) as executor:
+            futures = {executor.submit(update_artist, artist, sheet_id): artist for artist, sheet_id in tasks}
+            for future in as_completed(futures):
+                try:
+                    files_to_archive.extend(future.result())
+                except Exception as e:
+                    logger.error("❌ Update failed for %s: %s", futures[future], e, exc_info=True)
 
-        for file_path, public_url in files_to_archive:
-            # Start archive threads with ~10 minute delay inside archive_file()
-            threading.Thread(target=archive_file, args=(file_path, public_url), daemon=True).start()
+        logger.info("✅ All downloads complete. Queueing %s files for archiving.", len(files_to_archive))
+        queue_archive_batch(files_to_archive)
 
+    invalidate_page(ARTIST_LIST_PAGE)
     save_csv(remote_data, CACHE_FILE)
-    print(f"[{datetime.now()}] 💾 Cache updated.\n")
+    save_metadata(CACHE_FILE, {
+        "etag": response.headers.get("ETag", ""),
+        "lastmodified": response.headers.get("Last-Modified", ""),
+    })
+    logger.info("💾 Cache updated.\n")
 
 
 def fetch_loop():
-    print(f"[{datetime.now()}] 🟢 Tracker started. Will fetch every hour.")
+    logger.info("🟢 Tracker started. Will fetch every hour.")
     while True:
         run_once()
-        print(f"[{datetime.now()}] 💤 Sleeping for {SLEEP_INTERVAL_SECONDS // 60} minutes...\n")
+        logger.info("💤 Sleeping for %s minutes...\n", SLEEP_INTERVAL_SECONDS // 60)
         time.sleep(SLEEP_INTERVAL_SECONDS)
 
 class SimpleHTTPRequestHandler(BaseHTTPRequestHandler):
@@ -260,7 +520,7 @@ class SimpleHTTPRequestHandler(BaseHTTPRequestHandler):
             self.send_response(200)
             self.send_header("Content-type", "text/html; charset=utf-8")
             self.end_headers()
-            html = self.build_artist_list_page()
+            html = cached_page(ARTIST_LIST_PAGE, EXPORT_DIR, self.build_artist_list_page)
             self.wfile.write(html.encode("utf-8"))
             return
 
@@ -280,6 +540,10 @@ class SimpleHTTPRequestHandler(BaseHTTPRequestHandler):
                 self.wfile.write(b"No 401 errors logged.\n")
             return
 
+        if path in (".", ".."):
+            self.send_error(404, "Artist not found")
+            return
+
         if path and "/" not in path:
             artist = path
             artist_dir = os.path.join(EXPORT_DIR, artist)
@@ -287,7 +551,7 @@ class SimpleHTTPRequestHandler(BaseHTTPRequestHandler):
                 self.send_response(200)
                 self.send_header("Content-type", "text/html; charset=utf-8")
                 self.end_headers()
-                html = self.build_artist_files_page(artist, artist_dir)
+                html = cached_page(artist, artist_dir, lambda: self.build_artist_files_page(artist, artist_dir))
                 self.wfile.write(html.encode("utf-8"))
                 return
             else:
@@ -296,7 +560,17 @@ class SimpleHTTPRequestHandler(BaseHTTPRequestHandler):
 
         if path.startswith("downloads/"):
             decoded_path = os.path.join(".", urllib.parse.unquote(path))
-            if os.path.isfile(decoded_path):
+            try:
+                # Open first so the length and body come from the same inode, even if
+                # a download os.replace()s the file while we're serving it
+                f = open(decoded_path, "rb") if os.path.isfile(decoded_path) else None
+            except OSError:
+                f = None
+            if f is None:
+                self.send_error(404, "File not found")
+                return
+            with f:
+                size = os.fstat(f.fileno()).st_size
                 self.send_response(200)
                 if decoded_path.endswith(".xlsx"):
                     self.send_header("Content-Type", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
@@ -304,18 +578,17 @@ class SimpleHTTPRequestHandler(BaseHTTPRequestHandler):
                     self.send_header("Content-Type", "text/html; charset=utf-8")
                 else:
                     self.send_header("Content-Type", "application/octet-stream")
-                self.send_header("Content-Length", str(os.path.getsize(decoded_path)))
+                self.send_header("Content-Length", str(size))
                 self.end_headers()
-                with open(decoded_path, "rb") as f:
-                    self.wfile.write(f.read())
-            else:
-                self.send_error(404, "File not found")
+                self.wfile.flush()
+                # Zero-copy via os.sendfile where supported, plain send() loop otherwise
+                self.connection.sendfile(f, count=size)
             return
 
         self.send_error(404, "Not found")
 
     def build_artist_list_page(self):
-        artists = sorted(os.listdir(EXPORT_DIR)) if os.path.exists(EXPORT_DIR) else []
+        artists = sorted(e.name for e in os.scandir(EXPORT_DIR) if e.is_dir()) if os.path.exists(EXPORT_DIR) else []
         html = [
             "<!DOCTYPE html><html><head><meta charset='utf-8'><title>Artists</title>",
             "<style>body { font-family: monospace; background:#111; color:#eee; padding:20px; }",
@@ -327,14 +600,19 @@ class SimpleHTTPRequestHandler(BaseHTTPRequestHandler):
         else:
             html.append("<ul>")
             for artist in artists:
-                if os.path.isdir(os.path.join(EXPORT_DIR, artist)):
-                    html.append(f"<li><a href='/{urllib.parse.quote(artist)}/'>{artist}</a></li>")
+                html.append(f"<li><a href='/{urllib.parse.quote(artist)}/'>{artist}</a></li>")
             html.append("</ul>")
         html.append("</body></html>")
         return "\n".join(html)
 
     def build_artist_files_page(self, artist, artist_dir):
-        files = sorted(os.listdir(artist_dir))
+        # Stat everything first, then hash in parallel so disk reads overlap
+        entries = sorted(
+            (e.name, e.path, e.stat()) for e in os.scandir(artist_dir)
+            if e.is_file() and not e.name.endswith((".meta", PARTIAL_SUFFIX))
+        )
+        hashes = list(HASH_EXECUTOR.map(cached_sha256, [path for _, path, _ in entries], [st for _, _, st in entries]))
+
         html = [
             f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>{artist} Files</title>",
             "<style>body { font-family: monospace; background:#111; color:#eee; padding:20px; }",
@@ -342,25 +620,21 @@ class SimpleHTTPRequestHandler(BaseHTTPRequestHandler):
             "</head><body>",
             f"<h1>Downloads for {artist}</h1><p><a href='/'>← Back to Artists</a></p><ul>"
         ]
-        for filename in files:
-            if filename.endswith(".meta"):
-                continue
-            full_path = os.path.join(artist_dir, filename)
-            if os.path.isfile(full_path):
-                mtime = os.path.getmtime(full_path)
-                mtime_str = format_timestamp(mtime)
-                filehash = sha256_of_file(full_path) or "N/A"
-                file_url = f"/downloads/{urllib.parse.quote(artist)}/{urllib.parse.quote(filename)}"
-                html.append(f"<li><a href='{file_url}'>{filename}</a> (Modified: {mtime_str}) SHA256: {filehash}</li>")
+        for (filename, _, st), filehash in zip(entries, hashes):
+            mtime_str = format_timestamp(st.st_mtime)
+            file_url = f"/downloads/{urllib.parse.quote(artist)}/{urllib.parse.quote(filename)}"
+            html.append(f"<li><a href='{file_url}'>{filename}</a> (Modified: {mtime_str}) SHA256: {filehash or 'N/A'}</li>")
         html.append("</ul></body></html>")
         return "\n".join(html)
 
 def start_http_server():
-    server = HTTPServer((HOST, PORT), SimpleHTTPRequestHandler)
-    print(f"[{datetime.now()}] 🌐 HTTP server started on http://{HOST}:{PORT}")
+    server = ThreadingHTTPServer((HOST, PORT), SimpleHTTPRequestHandler)
+    logger.info("🌐 HTTP server started on http://%s:%s", HOST, PORT)
     server.serve_forever()
 
 def main():
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+    start_archive_workers()
     threading.Thread(target=fetch_loop, daemon=True).start()
     start_http_server()
 